@@ -2,32 +2,80 @@
 Code Review Assistant - FastAPI backend with OpenAI integration (2025-compatible)
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Depends
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Query, Body
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Float, JSON
+from sqlalchemy import TypeDecorator, Column, Integer, String, Text, DateTime, Float, Index, bindparam, event, insert, select, text, tuple_, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncConnection, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from contextlib import asynccontextmanager
 from enum import Enum
-from openai import OpenAI
+from types import MappingProxyType
+from collections import OrderedDict
+import asyncio
+import base64
+import hashlib
 import os
-import json
+import orjson
 from dotenv import load_dotenv
-from colorama import Fore, Style  
 load_dotenv()
 
+GREEN, YELLOW = "32", "33"
+
+def _c(s: str, code: str) -> str:
+    """Wrap s in an ANSI color escape for one-shot status logging."""
+    return f"\x1b[{code}m{s}\x1b[0m"
+
 api_key = os.getenv("OPENAI_API_KEY")
 
 if api_key:
-    print(f"{Fore.GREEN}✅ OPENAI_API_KEY loaded successfully!{Style.RESET_ALL}")
+    print(_c("✅ OPENAI_API_KEY loaded successfully!", GREEN))
 else:
-    print(f"{Fore.YELLOW}⚠️  No OPENAI_API_KEY found. Using static fallback mode.{Style.RESET_ALL}")
+    print(_c("⚠️  No OPENAI_API_KEY found. Using static fallback mode.", YELLOW))
+
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./code_reviews.db"
+# Long-lived pooled connections keep SQLite's page cache warm across requests
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=10,
+)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers run alongside the writer and turns commits into appends."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+
+
+class UTCDateTime(TypeDecorator):
+    """Stores naive UTC like a plain DateTime and hands back UTC-aware values on read."""
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value, dialect):
+        return value.replace(tzinfo=timezone.utc) if value is not None else None
+
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./code_reviews.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
@@ -39,14 +87,16 @@ class ReviewReport(Base):
     language = Column(String)
     code_content = Column(Text)
     score = Column(Float)
-    issues = Column(JSON)
-    suggestions = Column(JSON)
-    metrics = Column(JSON)
-    timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    # Pre-serialized JSON text, written once and returned verbatim on reads
+    issues = Column(Text)
+    suggestions = Column(Text)
+    metrics = Column(Text)
+    timestamp = Column(UTCDateTime, default=lambda: datetime.now(timezone.utc))
     user_id = Column(String, nullable=True)
 
+    # Serves newest-first keyset pagination on /reviews; id breaks ties between equal timestamps
+    __table_args__ = (Index("ix_reviews_ts_desc", timestamp.desc(), id.desc()),)
 
-Base.metadata.create_all(bind=engine)
 
 class SeverityEnum(str, Enum):
     ERROR = "error"
@@ -71,6 +121,19 @@ class CodeMetrics(BaseModel):
     test_coverage: Optional[float] = None
 
 
+class LLMMetrics(BaseModel):
+    complexity: Optional[int] = None
+
+
+class LLMReview(BaseModel):
+    """Shape an LLM reply must have before it is used or cached."""
+    score: float = 75
+    issues: List[Issue] = []
+    suggestions: List[str] = []
+    summary: str = "Code review completed"
+    metrics: Optional[LLMMetrics] = None
+
+
 class ReviewResponse(BaseModel):
     id: int
     filename: str
@@ -83,12 +146,99 @@ class ReviewResponse(BaseModel):
     summary: str
 
 
+IssueList = TypeAdapter(List[Issue])
+
+
+class ReviewJSONResponse(Response):
+    """Renders with orjson so stored JSON columns can be embedded as orjson.Fragment."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+class ReviewPage(BaseModel):
+    items: List[ReviewResponse]
+    next_cursor: Optional[str] = None
+
+
 class CodeSubmission(BaseModel):
     code: str
     language: str
-    filename: Optional[str] = "code_snippet"
+    filename: str = "code_snippet"
 
-app = FastAPI(title="Code Review Assistant API", version="1.0.1")
+# Bumped via SQLite's user_version once stored rows have been brought up to the current format
+SCHEMA_VERSION = 1
+
+def _load_legacy_json(value: Optional[str], expected: type) -> Any:
+    """Parse a legacy JSON column, treating NULL, unparseable or wrongly-typed values as empty."""
+    try:
+        loaded = orjson.loads(value or "null")
+    except orjson.JSONDecodeError:
+        return expected()
+    return loaded if isinstance(loaded, expected) else expected()
+
+def _normalize_legacy_row(issues: Optional[str], suggestions: Optional[str], metrics: Optional[str]) -> Dict[str, str]:
+    """Re-serialize JSON columns written before they were validated on insert."""
+    valid_issues = []
+    for raw in _load_legacy_json(issues, list):
+        try:
+            valid_issues.append(Issue.model_validate(raw))
+        except ValidationError:
+            continue
+    # Start from zeros and keep each stored metric that validates on its own
+    valid_metrics = dict(lines=0, functions=0, classes=0, complexity=0, duplicates=0)
+    for field, value in _load_legacy_json(metrics, dict).items():
+        if field not in CodeMetrics.model_fields:
+            continue
+        try:
+            valid_metrics = CodeMetrics.model_validate({**valid_metrics, field: value}).model_dump()
+        except ValidationError:
+            continue
+    return {
+        "b_issues": IssueList.dump_json(valid_issues).decode(),
+        "b_suggestions": orjson.dumps([str(s) for s in _load_legacy_json(suggestions, list)]).decode(),
+        "b_metrics": CodeMetrics(**valid_metrics).model_dump_json(),
+    }
+
+async def _migrate_legacy_rows(conn: AsyncConnection) -> None:
+    if (await conn.execute(text("PRAGMA user_version"))).scalar() >= SCHEMA_VERSION:
+        return
+    rows = (await conn.execute(
+        select(ReviewReport.id, ReviewReport.issues, ReviewReport.suggestions, ReviewReport.metrics)
+    )).all()
+    if rows:
+        await conn.execute(
+            update(ReviewReport)
+            .where(ReviewReport.id == bindparam("b_id"))
+            .values(issues=bindparam("b_issues"), suggestions=bindparam("b_suggestions"), metrics=bindparam("b_metrics")),
+            [{"b_id": r.id, **_normalize_legacy_row(r.issues, r.suggestions, r.metrics)} for r in rows],
+        )
+    await conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+
+# Set by the __main__ launcher once it has prepared the database, so workers skip the DDL
+SCHEMA_READY_ENV = "CODE_REVIEW_SCHEMA_READY"
+
+async def init_db() -> None:
+    """Create tables and indexes and migrate legacy rows; none of these steps is safe to race."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all skips indexes on tables that already exist, so add any new ones explicitly
+        await conn.run_sync(
+            lambda sync_conn: [ix.create(sync_conn, checkfirst=True) for ix in ReviewReport.__table__.indexes]
+        )
+        await _migrate_legacy_rows(conn)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if not os.getenv(SCHEMA_READY_ENV):
+        await init_db()
+    yield
+    await llm_reviewer.aclose()
+    await engine.dispose()
+
+app = FastAPI(title="Code Review Assistant API", version="1.0.1", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -99,12 +249,15 @@ app.add_middleware(
 )
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+# Upper bound on OpenAI requests in flight per worker
+MAX_CONCURRENCY = 16
+# Number of LLM reviews kept in the per-worker exact-match cache
+LLM_CACHE_SIZE = 10_000
+
 
 class CodeReviewLLM:
     def __init__(self):
@@ -113,29 +266,81 @@ class CodeReviewLLM:
             print("⚠️  No OPENAI_API_KEY found. Using static fallback mode.")
             self.client = None
         else:
-            self.client = OpenAI(api_key=self.api_key)
+            # Imported lazily: workers running in fallback mode never pay for loading the SDK
+            import httpx
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+            # One pooled HTTP/2 client per worker so concurrent reviews multiplex over warm connections
+            self.client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=DefaultAsyncHttpxClient(
+                    http2=True,
+                    timeout=60,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                ),
+            )
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        # Serialized LLM results keyed by a digest of (language, code), least recently used first
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+    async def aclose(self) -> None:
+        if self.client:
+            await self.client.close()
 
-    def analyze_code(self, code: str, language: str) -> Dict[str, Any]:
+    async def analyze_code(self, code: str, language: str) -> Dict[str, Any]:
         """Main analysis function."""
         if not self.client:
-            return self._fallback_analysis(code, language)
+            return await run_in_threadpool(self._fallback_analysis, code, language)
+
+        key = self._cache_key(code, language)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return orjson.loads(cached)
 
         prompt = self._build_prompt(code, language)
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are an expert code reviewer who provides structured JSON feedback."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.3,
-                max_tokens=1800,
-            )
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": "You are an expert code reviewer who provides structured JSON feedback."},
+                        {"role": "user", "content": prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=1800,
+                )
             result = response.choices[0].message.content
-            return self._parse_llm_response(result)
         except Exception as e:
             print(f"❌ LLM API Error: {e}")
-            return self._fallback_analysis(code, language)
+            return await run_in_threadpool(self._fallback_analysis, code, language)
+
+        parsed = self._parse_llm_response(result)
+        if parsed is None:
+            return self._fallback_analysis("", "unknown")
+        try:
+            # Validate before caching so a bad reply is retried rather than replayed from the cache
+            review = LLMReview.model_validate(parsed).model_dump(mode="json", exclude_none=True)
+        except ValidationError:
+            print("⚠️  LLM returned JSON outside the review schema — using fallback.")
+            return self._fallback_analysis("", "unknown")
+        self._cache_store(key, review)
+        return review
+
+    async def analyze_many(self, submissions: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Analyze several (code, language) pairs concurrently."""
+        return await asyncio.gather(*(self.analyze_code(code, language) for code, language in submissions))
+
+    @staticmethod
+    def _cache_key(code: str, language: str) -> str:
+        return hashlib.blake2b(f"{language}\0{code}".encode(), digest_size=16).hexdigest()
+
+    def _cache_store(self, key: str, result: Dict[str, Any]) -> None:
+        # Stored as bytes so callers always get a fresh dict they are free to mutate
+        self._cache[key] = orjson.dumps(result)
+        self._cache.move_to_end(key)
+        if len(self._cache) > LLM_CACHE_SIZE:
+            self._cache.popitem(last=False)
 
     def _build_prompt(self, code: str, language: str) -> str:
         return f"""Review this {language} code for:
@@ -161,15 +366,14 @@ Code:
 {code}
 ```"""
 
-    def _parse_llm_response(self, response: str) -> Dict[str, Any]:
+    def _parse_llm_response(self, response: str) -> Optional[Dict[str, Any]]:
         try:
             start = response.find("{")
             end = response.rfind("}") + 1
-            json_str = response[start:end]
-            return json.loads(json_str)
+            return orjson.loads(response[start:end])
         except Exception:
             print("⚠️  LLM returned malformed JSON — using fallback.")
-            return self._fallback_analysis("", "unknown")
+            return None
 
     def _fallback_analysis(self, code: str, language: str) -> Dict[str, Any]:
         lines = code.split("\n")
@@ -206,130 +410,236 @@ Code:
 
 llm_reviewer = CodeReviewLLM()
 
+# Read-only lookup tables shared by upload language detection and calculate_metrics,
+# all keyed by the same normalized language names
+LANGUAGE_EXTENSIONS = MappingProxyType({
+    "js": "javascript", "jsx": "javascript",
+    "ts": "typescript", "tsx": "typescript",
+    "py": "python", "java": "java",
+    "cpp": "cpp", "cc": "cpp",
+    "go": "go", "rs": "rust"
+})
+FUNCTION_PATTERNS = MappingProxyType({
+    "python": ("def ",),
+    "javascript": ("function ", "=>"),
+    "java": ("public ", "void "),
+    "cpp": ("int ", "void ", "class ")
+})
+COMPLEXITY_KEYWORDS = ("if", "for", "while", "case", "catch", "&&", "||")
+CLASS_PATTERN = "class "
+
+def _metric_patterns(language: str) -> Tuple[str, ...]:
+    # dict.fromkeys de-duplicates while keeping order, so shared patterns are scanned once
+    return tuple(dict.fromkeys((*FUNCTION_PATTERNS.get(language, ()), CLASS_PATTERN, *COMPLEXITY_KEYWORDS)))
+
+# Distinct patterns to scan for each language, computed once at import time
+METRIC_PATTERNS = MappingProxyType({language: _metric_patterns(language) for language in FUNCTION_PATTERNS})
+DEFAULT_METRIC_PATTERNS = _metric_patterns("")
+
 def calculate_metrics(code: str, language: str) -> CodeMetrics:
+    # Every scan below is a native str.count/split loop; no per-character Python work
     lines = code.split("\n")
-    function_patterns = {
-        "python": ["def "],
-        "javascript": ["function ", "=>"],
-        "java": ["public ", "void "],
-        "cpp": ["int ", "void ", "class "]
-    }
-    fn_count = sum(code.count(p) for p in function_patterns.get(language, []))
-    cls_count = code.count("class ")
-    complexity_keywords = ["if", "for", "while", "case", "catch", "&&", "||"]
-    complexity = sum(code.count(k) for k in complexity_keywords)
+    line_count = len(lines)
+    counts = {p: code.count(p) for p in METRIC_PATTERNS.get(language, DEFAULT_METRIC_PATTERNS)}
+    fn_count = sum(counts[p] for p in FUNCTION_PATTERNS.get(language, ()))
+    cls_count = counts[CLASS_PATTERN]
+    complexity = sum(counts[k] for k in COMPLEXITY_KEYWORDS)
     complexity_score = min(10, complexity // 3)
-    duplicates = len(lines) - len(set(lines))
+    duplicates = line_count - len(set(lines))
     return CodeMetrics(
-        lines=len(lines),
+        lines=line_count,
         functions=fn_count,
         classes=cls_count,
         complexity=complexity_score,
         duplicates=duplicates
     )
 
+# Most snippets accepted by one /review/bulk request; bounds the OpenAI calls it can start
+MAX_BULK = 50
+# Rows per multi-row INSERT in /review/bulk, well under SQLite's bound-parameter limit
+BULK_INSERT_CHUNK = 100
+
+# Uploads larger than this are rejected before they are decoded or reviewed
+MAX_UPLOAD = 2_000_000
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 @app.get("/")
 async def root():
     return {"message": "Code Review Assistant API (2025-ready)", "version": "1.0.1"}
 
-@app.post("/review", response_model=ReviewResponse)
-async def review_code(submission: CodeSubmission, db: Session = Depends(get_db)):
-    """Submit code for review"""
-    llm_result = llm_reviewer.analyze_code(submission.code, submission.language)
-    metrics = calculate_metrics(submission.code, submission.language)
+def _build_review(code: str, language: str, filename: str, llm_result: Dict[str, Any]) -> Dict[str, Any]:
+    # Validate LLM output before it is stored so reads can trust the rows as-is
+    metrics = calculate_metrics(code, language)
     if "metrics" in llm_result:
-        metrics.complexity = llm_result["metrics"].get("complexity", metrics.complexity)
-
-    db_review = ReviewReport(
-        filename=submission.filename,
-        language=submission.language,
-        code_content=submission.code,
-        score=llm_result.get("score", 75),
-        issues=llm_result.get("issues", []),
-        suggestions=llm_result.get("suggestions", []),
-        metrics=metrics.model_dump(),
+        complexity = llm_result["metrics"].get("complexity", metrics.complexity)
+        metrics = CodeMetrics(**{**metrics.model_dump(), "complexity": complexity})
+    issues = [Issue(**i) for i in llm_result.get("issues", [])]
+
+    return dict(
+        filename=filename,
+        language=language,
+        code_content=code,
+        score=float(llm_result.get("score", 75)),
+        issues=IssueList.dump_json(issues).decode(),
+        suggestions=orjson.dumps([str(s) for s in llm_result.get("suggestions", [])]).decode(),
+        metrics=metrics.model_dump_json(),
         timestamp=datetime.now(timezone.utc)
     )
+
+# Columns the read endpoints select directly as Core rows: no mapped instances, identity map
+# or unit-of-work bookkeeping, and the stored source code is never loaded
+REVIEW_COLUMNS = (
+    ReviewReport.id,
+    ReviewReport.filename,
+    ReviewReport.language,
+    ReviewReport.score,
+    ReviewReport.issues,
+    ReviewReport.suggestions,
+    ReviewReport.metrics,
+    ReviewReport.timestamp,
+)
+
+def _to_response(db_review: Any, summary: str) -> Dict[str, Any]:
+    """Render a ReviewReport instance or a REVIEW_COLUMNS row; both expose the same attributes."""
+    # JSON columns were validated and serialized in _build_review; splice them in without re-parsing
+    return {
+        "id": db_review.id,
+        "filename": db_review.filename,
+        "language": db_review.language,
+        "score": db_review.score,
+        "issues": orjson.Fragment(db_review.issues),
+        "suggestions": orjson.Fragment(db_review.suggestions),
+        "metrics": orjson.Fragment(db_review.metrics),
+        "timestamp": db_review.timestamp,
+        "summary": summary,
+    }
+
+async def _do_review(code: str, language: str, filename: str, db: AsyncSession) -> ReviewJSONResponse:
+    """Review, store and render a single submission; shared by /review and /review/upload."""
+    llm_result = await llm_reviewer.analyze_code(code, language)
+    # Metrics and validation are CPU-bound on large files; keep them off the event loop
+    db_review = ReviewReport(**await run_in_threadpool(_build_review, code, language, filename, llm_result))
     db.add(db_review)
-    db.commit()
-    db.refresh(db_review)
-
-    return ReviewResponse(
-        id=db_review.id,
-        filename=db_review.filename,
-        language=db_review.language,
-        score=db_review.score,
-        issues=[Issue(**i) for i in db_review.issues],
-        suggestions=db_review.suggestions,
-        metrics=CodeMetrics(**db_review.metrics),
-        timestamp=db_review.timestamp,
-        summary=llm_result.get("summary", "Code review completed")
+    await db.commit()
+
+    return ReviewJSONResponse(_to_response(db_review, llm_result.get("summary", "Code review completed")))
+
+@app.post("/review", response_model=ReviewResponse)
+async def review_code(submission: CodeSubmission, db: AsyncSession = Depends(get_db)):
+    """Submit code for review"""
+    return await _do_review(submission.code, submission.language, submission.filename, db)
+
+@app.post("/review/bulk", response_model=List[ReviewResponse])
+async def review_bulk(submissions: List[CodeSubmission] = Body(..., max_length=MAX_BULK), db: AsyncSession = Depends(get_db)):
+    """Submit several snippets for review in one request"""
+    if not submissions:
+        return []
+    llm_results = await llm_reviewer.analyze_many([(s.code, s.language) for s in submissions])
+    rows = await run_in_threadpool(
+        lambda: [_build_review(s.code, s.language, s.filename, r) for s, r in zip(submissions, llm_results)]
     )
+    # Multi-row INSERT ... VALUES ... RETURNING per chunk and a single commit for the whole batch
+    ids = []
+    for start in range(0, len(rows), BULK_INSERT_CHUNK):
+        chunk = rows[start:start + BULK_INSERT_CHUNK]
+        result = await db.scalars(insert(ReviewReport).values(chunk).returning(ReviewReport.id))
+        # SQLite assigns rowids in VALUES order, but RETURNING order is unspecified
+        ids.extend(sorted(result.all()))
+    await db.commit()
+    db_reviews = [ReviewReport(id=review_id, **row) for review_id, row in zip(ids, rows)]
+
+    return ReviewJSONResponse([
+        _to_response(db_review, r.get("summary", "Code review completed"))
+        for db_review, r in zip(db_reviews, llm_results)
+    ])
 
 @app.post("/review/upload", response_model=ReviewResponse)
-async def review_file(file: UploadFile = File(...), db: Session = Depends(get_db)):
+async def review_file(file: UploadFile = File(...), db: AsyncSession = Depends(get_db)):
     """Upload file for review"""
-    code = await file.read()
-    code_str = code.decode("utf-8")
-    ext = file.filename.split(".")[-1]
-    lang_map = {
-        "js": "javascript", "jsx": "javascript",
-        "ts": "typescript", "tsx": "typescript",
-        "py": "python", "java": "java",
-        "cpp": "cpp", "cc": "cpp",
-        "go": "go", "rs": "rust"
-    }
-    language = lang_map.get(ext, "unknown")
-    submission = CodeSubmission(code=code_str, language=language, filename=file.filename)
-    return await review_code(submission, db)
-
-@app.get("/reviews", response_model=List[ReviewResponse])
-async def get_reviews(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    """Get list of recent reviews"""
-    reviews = db.query(ReviewReport).order_by(ReviewReport.timestamp.desc()).offset(skip).limit(limit).all()
-    return [
-        ReviewResponse(
-            id=r.id,
-            filename=r.filename,
-            language=r.language,
-            score=r.score,
-            issues=[Issue(**i) for i in r.issues],
-            suggestions=r.suggestions,
-            metrics=CodeMetrics(**r.metrics),
-            timestamp=r.timestamp,
-            summary=f"Review of {r.filename}"
-        )
-        for r in reviews
-    ]
+    if file.size is not None and file.size > MAX_UPLOAD:
+        raise HTTPException(status_code=413, detail="File too large")
+    buf = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD:
+            raise HTTPException(status_code=413, detail="File too large")
+    code_str = buf.decode("utf-8", errors="replace")
+    filename = file.filename or "code_snippet"
+    ext = filename.rsplit(".", 1)[-1].lower()
+    language = LANGUAGE_EXTENSIONS.get(ext, "unknown")
+    return await _do_review(code_str, language, filename, db)
+
+def _encode_cursor(review: Any) -> str:
+    # base64url keeps the "+00:00" offset and separators safe to paste into a query string unencoded
+    raw = f"{review.timestamp.isoformat()}_{review.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, review_id = raw.rsplit("_", 1)
+        return datetime.fromisoformat(timestamp), int(review_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@app.get("/reviews", response_model=ReviewPage)
+async def get_reviews(cursor: Optional[str] = None, limit: int = Query(10, ge=1, le=100), db: AsyncSession = Depends(get_db)):
+    """Get a page of recent reviews, newest first; pass next_cursor back to fetch the following page"""
+    query = (
+        select(*REVIEW_COLUMNS)
+        .order_by(ReviewReport.timestamp.desc(), ReviewReport.id.desc())
+        .limit(limit)
+    )
+    if cursor:
+        # Keyset pagination: an index range scan from the cursor instead of reading and skipping an offset
+        query = query.where(tuple_(ReviewReport.timestamp, ReviewReport.id) < tuple_(*_decode_cursor(cursor)))
+    reviews = (await db.execute(query)).all()
+    next_cursor = _encode_cursor(reviews[-1]) if reviews and len(reviews) == limit else None
+    return ReviewJSONResponse({
+        "items": [_to_response(r, f"Review of {r.filename}") for r in reviews],
+        "next_cursor": next_cursor,
+    })
 
 @app.get("/reviews/{review_id}", response_model=ReviewResponse)
-async def get_review(review_id: int, db: Session = Depends(get_db)):
+async def get_review(review_id: int, db: AsyncSession = Depends(get_db)):
     """Fetch a review by ID"""
-    review = db.query(ReviewReport).filter(ReviewReport.id == review_id).first()
+    result = await db.execute(select(*REVIEW_COLUMNS).where(ReviewReport.id == review_id))
+    review = result.first()
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
-    return ReviewResponse(
-        id=review.id,
-        filename=review.filename,
-        language=review.language,
-        score=review.score,
-        issues=[Issue(**i) for i in review.issues],
-        suggestions=review.suggestions,
-        metrics=CodeMetrics(**review.metrics),
-        timestamp=review.timestamp,
-        summary=f"Review of {review.filename}"
-    )
+    return ReviewJSONResponse(_to_response(review, f"Review of {review.filename}"))
 
 @app.delete("/reviews/{review_id}")
-async def delete_review(review_id: int, db: Session = Depends(get_db)):
+async def delete_review(review_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a review"""
-    review = db.query(ReviewReport).filter(ReviewReport.id == review_id).first()
+    review = await db.get(ReviewReport, review_id)
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
-    db.delete(review)
-    db.commit()
+    await db.delete(review)
+    await db.commit()
     return {"message": "Review deleted successfully"}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+
+    async def _prepare_database() -> None:
+        await init_db()
+        await engine.dispose()
+
+    # Prepare the schema once here, before uvicorn spawns workers that would otherwise race on it
+    asyncio.run(_prepare_database())
+    os.environ[SCHEMA_READY_ENV] = "1"
+
+    if os.getenv("APP_ENV", "dev") == "prod":
+        # reload forces a single process; prod runs one worker per core on uvloop + httptools
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("WORKERS", os.cpu_count() or 1)),
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+        )
+    else:
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)